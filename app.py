@@ -1,21 +1,31 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import joblib
+from core import encode, predict, predict_sweep
 import numpy as np
-from datetime import datetime
 
-# Page configuration
-st.set_page_config(
-    page_title="House Price Predictor",
-    page_icon="🏠",
-    layout="wide",
-    initial_sidebar_state="expanded"
+# Preallocated input row for the model. The forest casts its input to
+# float32 internally, so storing float32 here skips that conversion.
+_FEAT = np.empty((1, 12), dtype=np.float32)
+
+# Yes/No features listed in the property checklist, in sidebar order
+_CHECKLIST_LABELS = (
+    "Main Road Access", "Guest Room", "Basement",
+    "Hot Water Heating", "Air Conditioning", "Preferred Area"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Features the sensitivity sweep can vary: label -> (column, low, high, points),
+# matching the ranges of the sidebar inputs
+_SWEEPS = {
+    "Area (sq ft)": (0, 1000, 20000, 50),
+    "Bedrooms": (1, 1, 8, 8),
+    "Bathrooms": (2, 1, 6, 6),
+    "Stories": (3, 1, 4, 4),
+    "Parking Spaces": (9, 0, 3, 4),
+}
+
+# Page styles for the full layout (_CSS) and the lite one (_LITE_CSS). Streamlit
+# drops any element a rerun does not emit again, so the active one is re-sent
+# every run; keeping them plain constants makes that a cheap literal.
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -51,7 +61,7 @@ st.markdown("""
         border-left: 5px solid #2E86AB;
         margin: 1rem 0;
     }
-    .stButton > button {
+    .stButton > button, .stFormSubmitButton > button {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
         border: none;
@@ -61,21 +71,56 @@ st.markdown("""
         font-size: 1.1rem;
         transition: all 0.3s ease;
     }
-    .stButton > button:hover {
+    .stButton > button:hover, .stFormSubmitButton > button:hover {
         transform: translateY(-2px);
         box-shadow: 0 5px 15px rgba(0,0,0,0.2);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_LITE_CSS = """
+<style>
+    .main-title {
+        color: #333;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .prediction-result {
+        background-color: #f0f8ff;
+        padding: 1.5rem;
+        border-radius: 10px;
+        text-align: center;
+        border: 1px solid #e0e0e0;
+        margin: 1rem 0;
+    }
+    .prediction-price {
+        font-size: 2rem;
+        font-weight: bold;
+        color: #2c3e50;
+        margin: 0.5rem 0;
+    }
+</style>
+"""
 
-@st.cache_resource
-def load_model():
-    try:
-        model = joblib.load('Housing.pkl')  # or Housing.joblib
-        return model
-    except FileNotFoundError:
-        st.error("Model file 'Housing.pkl' not found.")
-        return None
+# ?mode=lite serves the compact single-page layout; anything else the full one
+_LITE = st.query_params.get("mode", "full") == "lite"
+
+# Page configuration
+if _LITE:
+    st.set_page_config(
+        page_title="House Price Predictor",
+        page_icon="🏠",
+        layout="centered"
+    )
+    st.markdown(_LITE_CSS, unsafe_allow_html=True)
+else:
+    st.set_page_config(
+        page_title="House Price Predictor",
+        page_icon="🏠",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(_CSS, unsafe_allow_html=True)
 
 # Main app
 def main():
@@ -83,9 +128,6 @@ def main():
     st.markdown('<h1 class="main-header">🏠 House Price Prediction System</h1>', unsafe_allow_html=True)
     st.markdown('<p style="text-align: center; font-size: 1.2rem; color: #666; margin-bottom: 3rem;">Get accurate house price predictions using advanced machine learning</p>', unsafe_allow_html=True)
     
-    # Load model
-    model = load_model()
-    
     # Sidebar for inputs
     st.sidebar.markdown('<h2 class="sub-header">🔧 House Features</h2>', unsafe_allow_html=True)
     st.sidebar.markdown("---")
@@ -93,7 +135,8 @@ def main():
     # Input features with better organization
     col1, col2 = st.columns(2)
     
-    with st.sidebar:
+    # Inputs sit in a form so editing them doesn't rerun the script until Predict is pressed
+    with st.sidebar.form("inputs"):
         st.markdown("### 📏 **Basic Information**")
         area = st.number_input(
             "Area (sq ft)",
@@ -147,6 +190,8 @@ def main():
             index=2,
             help="Current furnishing status"
         )
+        
+        submitted = st.form_submit_button("🔮 Predict House Price", use_container_width=True)
     
     # Main content area
     with col1:
@@ -155,53 +200,35 @@ def main():
         # Create a summary display
         summary_data = {
             "Feature": ["Area", "Bedrooms", "Bathrooms", "Stories", "Parking", "Furnishing"],
-            "Value": [f"{area:,} sq ft", bedrooms, bathrooms, stories, parking, furnishingstatus.title()]
+            "Value": [f"{area:,} sq ft", str(bedrooms), str(bathrooms), str(stories), str(parking), furnishingstatus.title()]
         }
         
-        summary_df = pd.DataFrame(summary_data)
-        st.dataframe(summary_df, use_container_width=True, hide_index=True)
+        # A plain column dict is enough for st.dataframe; all-string values keep the column a single type
+        st.dataframe(summary_data, use_container_width=True, hide_index=True)
         
         # Feature checklist
         st.markdown('<div class="info-box">', unsafe_allow_html=True)
         st.markdown("**🔍 Property Features:**")
-        features = [
-            f"{'✅' if mainroad == 'Yes' else '❌'} Main Road Access",
-            f"{'✅' if guestroom == 'Yes' else '❌'} Guest Room",
-            f"{'✅' if basement == 'Yes' else '❌'} Basement",
-            f"{'✅' if hotwaterheating == 'Yes' else '❌'} Hot Water Heating",
-            f"{'✅' if airconditioning == 'Yes' else '❌'} Air Conditioning",
-            f"{'✅' if prefarea == 'Yes' else '❌'} Preferred Area"
-        ]
-        for feature in features:
-            st.markdown(f"- {feature}")
+        values = (mainroad, guestroom, basement, hotwaterheating, airconditioning, prefarea)
+        st.markdown("\n".join(
+            f"- {'✅' if value == 'Yes' else '❌'} {label}"
+            for label, value in zip(_CHECKLIST_LABELS, values)
+        ))
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
         st.markdown('<h2 class="sub-header">🎯 Price Prediction</h2>', unsafe_allow_html=True)
         
-        # Convert categorical inputs to numerical
-        mainroad_val = 1 if mainroad == "Yes" else 0
-        guestroom_val = 1 if guestroom == "Yes" else 0
-        basement_val = 1 if basement == "Yes" else 0
-        hotwaterheating_val = 1 if hotwaterheating == "Yes" else 0
-        airconditioning_val = 1 if airconditioning == "Yes" else 0
-        prefarea_val = 1 if prefarea == "Yes" else 0
-        
-        # Map furnishing status to numerical
-        furnishing_map = {"unfurnished": 0, "semi-furnished": 1, "furnished": 2}
-        furnishing_val = furnishing_map[furnishingstatus]
-        
-        # Prepare input for prediction
-        input_features = [
-            area, bedrooms, bathrooms, stories, mainroad_val, 
-            guestroom_val, basement_val, hotwaterheating_val, 
-            airconditioning_val, parking, prefarea_val, furnishing_val
-        ]
+        features = encode(
+            area, bedrooms, bathrooms, stories, mainroad,
+            guestroom, basement, hotwaterheating,
+            airconditioning, parking, prefarea, furnishingstatus
+        )
         
-        if st.button("🔮 Predict House Price", use_container_width=True):
+        if submitted:
             try:
                 # Make prediction
-                prediction = model.predict([input_features])[0]
+                prediction = predict(features, _FEAT)
                 
                 # Display prediction with animation effect
                 st.markdown(f'''
@@ -214,6 +241,20 @@ def main():
                 
             except Exception as e:
                 st.error(f"Error making prediction: {str(e)}")
+        
+        # Sensitivity sweep: the whole curve comes from one batched predict call
+        if st.toggle("📈 Sensitivity", help="See how the predicted price changes as one feature varies"):
+            label = st.selectbox("Vary", list(_SWEEPS))
+            column, low, high, num = _SWEEPS[label]
+            try:
+                prices = predict_sweep(features, column, low, high, num)
+                st.line_chart(
+                    {label: np.linspace(low, high, num), "Predicted Price": prices},
+                    x=label,
+                    y="Predicted Price"
+                )
+            except Exception as e:
+                st.error(f"Error making prediction: {str(e)}")
 
     
     # Footer
@@ -223,5 +264,58 @@ def main():
         unsafe_allow_html=True
     )
 
+# Lite layout
+def main_lite():
+    st.markdown('<h1 class="main-title">🏠 House Price Predictor</h1>', unsafe_allow_html=True)
+    
+    # Input form
+    st.subheader("Enter House Details")
+    
+    # Inputs sit in a form so editing them doesn't rerun the script until Predict is pressed
+    with st.form("inputs"):
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            area = st.number_input("Area (sq ft)", min_value=1000, max_value=20000, value=7000, step=100)
+            bedrooms = st.selectbox("Bedrooms", [1, 2, 3, 4, 5, 6, 7, 8], index=3)
+            bathrooms = st.selectbox("Bathrooms", [1, 2, 3, 4, 5, 6], index=2)
+            stories = st.selectbox("Stories", [1, 2, 3, 4], index=2)
+            parking = st.selectbox("Parking Spaces", [0, 1, 2, 3], index=2)
+            furnishing = st.selectbox("Furnishing", ["unfurnished", "semi-furnished", "furnished"], index=2)
+    
+        with col2:
+            mainroad = st.selectbox("Main Road Access", ["No", "Yes"], index=1)
+            guestroom = st.selectbox("Guest Room", ["No", "Yes"], index=1)
+            basement = st.selectbox("Basement", ["No", "Yes"], index=1)
+            hotwaterheating = st.selectbox("Hot Water Heating", ["No", "Yes"], index=1)
+            airconditioning = st.selectbox("Air Conditioning", ["No", "Yes"], index=1)
+            prefarea = st.selectbox("Preferred Area", ["No", "Yes"], index=1)
+    
+        submitted = st.form_submit_button("Predict Price", use_container_width=True)
+    
+    # Predict button
+    if submitted:
+        # Make prediction
+        try:
+            prediction = predict(encode(
+                area, bedrooms, bathrooms, stories, mainroad,
+                guestroom, basement, hotwaterheating,
+                airconditioning, parking, prefarea, furnishing
+            ), _FEAT)
+            
+            # Display result
+            st.markdown(f'''
+            <div class="prediction-result">
+                <h3 id = "predicted-house-price" style = "color:#0b0505" >Predicted House Price</h3>
+                <div class="prediction-price">${prediction:,.2f}</div>
+            </div>
+            ''', unsafe_allow_html=True)
+            
+        except Exception as e:
+            st.error(f"Error making prediction: {str(e)}")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if _LITE:
+        main_lite()
+    else:
+        main()
@@ -0,0 +1,189 @@
+# Feature encoding and model loading for app.py. Kept in its own module so it is
+# imported once per server process instead of re-executed on every rerun.
+import os
+import threading
+import streamlit as st
+import joblib
+import numpy as np
+from kernels import kernel_name, walk_forest
+from export_model import source_digest, stamp_path
+
+try:
+    # Ahead-of-time build from export_model.export_kernels: no JIT cost at all
+    import housing_kernels
+except ImportError:
+    housing_kernels = None
+
+# Categorical encodings used when the model was trained (see app.ipynb)
+YES_NO = {"No": 0, "Yes": 1}
+FURNISHING = {"unfurnished": 0, "semi-furnished": 1, "furnished": 2}
+
+
+def encode(area, bedrooms, bathrooms, stories, mainroad, guestroom, basement,
+           hotwaterheating, airconditioning, parking, prefarea, furnishingstatus):
+    # Raw widget values -> model feature tuple, in training column order
+    return (
+        area, bedrooms, bathrooms, stories, YES_NO[mainroad],
+        YES_NO[guestroom], YES_NO[basement], YES_NO[hotwaterheating],
+        YES_NO[airconditioning], parking, YES_NO[prefarea], FURNISHING[furnishingstatus]
+    )
+
+
+class _OnnxModel:
+    # Minimal predict() wrapper so an ONNX Runtime session can stand in for the sklearn model
+    def __init__(self, session):
+        self.session = session
+
+    def predict(self, X):
+        return self.session.run(None, {'input': X})[0][:, 0]
+
+
+class _LinearModel:
+    # Linear estimators reduce to one dot product; doing it directly skips
+    # sklearn's per-call check_array validation and copy
+    def __init__(self, model):
+        self.coef = np.asarray(model.coef_, dtype=np.float64)
+        self.intercept = np.ravel(model.intercept_)[0].item()
+
+    def predict(self, X):
+        return X @ self.coef + self.intercept
+
+
+class _TreeliteModel:
+    # Forest compiled to native code by treelite/tl2cgen (export_model.export_lib)
+    def __init__(self, tl2cgen, path):
+        self.tl2cgen = tl2cgen
+        self.predictor = tl2cgen.Predictor(path)
+
+    def predict(self, X):
+        return self.predictor.predict(self.tl2cgen.DMatrix(X)).reshape(len(X))
+
+
+def _jit_kernel():
+    # numba takes a noticeable time to import, so it is only loaded when no
+    # matching AOT build exists
+    try:
+        from numba import njit
+    except ImportError:  # _ForestModel walks the trees with NumPy instead
+        return None
+    return njit(cache=True, fastmath=True)(walk_forest)
+
+
+class _ForestModel:
+    # Random forest flattened into node arrays by export_model.export_arrays.
+    # The arrays are memory-mapped, so nothing is unpickled and the OS page
+    # cache supplies the nodes on demand.
+    def __init__(self, directory):
+        # Read-only file mappings already share physical pages across worker
+        # processes through the page cache, so no shared-memory copy is needed
+        self.left, self.right, self.feature, self.threshold, self.value, self.roots = (
+            np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')
+            for name in ('left', 'right', 'feature', 'threshold', 'value', 'roots')
+        )
+        self.depth = int(np.load(os.path.join(directory, 'depth.npy')))
+        # Only an AOT build compiled for exactly these dtypes is safe to call
+        # (pycc does not check them); anything else uses the JIT kernel
+        aot = getattr(housing_kernels, kernel_name(
+            self.left, self.right, self.feature, self.threshold, self.value, self.roots
+        ), None)
+        self.kernel = aot if aot is not None else _jit_kernel()
+
+    def predict(self, X):
+        if self.kernel is not None:
+            X = np.ascontiguousarray(X, dtype=np.float32)
+            return self.kernel(X, self.left, self.right, self.feature, self.threshold,
+                               self.value, self.roots, np.empty(len(X)))
+        # Walk all trees for all rows at once; leaves loop back to themselves
+        rows = np.arange(len(X))[:, None]
+        node = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.value[node].mean(axis=1)
+
+
+def _fresh(artifact, digest):
+    # An export is only served if it was built from the current Housing.pkl;
+    # after a retrain without re-running export_model.py the pickle is used
+    if not os.path.exists(artifact):
+        return False
+    if digest is None:  # no pickle to be stale against
+        return True
+    try:
+        with open(stamp_path(artifact)) as f:
+            return f.read().strip() == digest
+    except FileNotFoundError:
+        return False
+
+
+@st.cache_resource(show_spinner=False)
+def load_model():
+    digest = source_digest() if os.path.exists('Housing.pkl') else None
+    # A locally compiled forest is the fastest to load and predicts exactly like sklearn
+    if _fresh('Housing.so', digest):
+        # Imported only here: Housing.so is built per host and absent from a checkout
+        try:
+            import tl2cgen
+        except ImportError:  # optional; fall through to the next backend
+            pass
+        else:
+            return _TreeliteModel(tl2cgen, 'Housing.so')
+    # The memory-mapped node arrays are also exact and avoid unpickling the estimator
+    if _fresh('Housing_forest', digest):
+        return _ForestModel('Housing_forest')
+    # The ONNX export runs the forest natively but sums leaves in float32, so
+    # prices can drift by a few dollars; used only when the exact exports are missing
+    if _fresh('Housing.onnx', digest):
+        # Imported only here so processes without an ONNX export don't pay for it
+        try:
+            import onnxruntime as ort
+        except ImportError:  # optional; fall through to the pickle
+            pass
+        else:
+            session = ort.InferenceSession('Housing.onnx', providers=['CPUExecutionProvider'])
+            return _OnnxModel(session)
+    try:
+        model = joblib.load('Housing.pkl')  # or Housing.joblib
+        # Plain single-target linear models skip sklearn's predict. GLMs such as
+        # PoissonRegressor also have coef_ but apply a link function, so they
+        # and the forests keep model.predict.
+        from sklearn.linear_model import ElasticNet, Lasso, LinearRegression, Ridge
+        if isinstance(model, (LinearRegression, Ridge, Lasso, ElasticNet)) and model.coef_.ndim == 1:
+            return _LinearModel(model)
+        return model
+    except FileNotFoundError:
+        st.error("Model file 'Housing.pkl' not found.")
+        return None
+
+
+def _warm_up():
+    # Only warm up when a backend with no optional dependency is present, so a
+    # missing model is still reported by the first script run instead of a
+    # cached silent None
+    if os.path.isdir('Housing_forest') or os.path.exists('Housing.pkl'):
+        # One throwaway prediction also JIT-compiles the forest kernel when it is in use
+        load_model().predict(np.zeros((1, 12), dtype=np.float32))
+
+
+@st.cache_data(max_entries=512)
+def predict(features: tuple, _out) -> float:
+    # Identical inputs are answered from the cache without touching the model.
+    # _out is the caller's preallocated (1, 12) float32 row; the leading
+    # underscore keeps it out of the cache key.
+    _out[0] = features
+    return float(load_model().predict(_out)[0])
+
+
+@st.cache_data(max_entries=64)
+def predict_sweep(features: tuple, column: int, low: float, high: float, num: int):
+    # The current inputs repeated once per sweep point with one column varied,
+    # so the whole curve costs a single batched predict call
+    X = np.tile(np.asarray(features, dtype=np.float32), (num, 1))
+    X[:, column] = np.linspace(low, high, num)
+    return load_model().predict(X)
+
+
+# This module is imported once per server process, so the model starts loading
+# while the first page renders instead of on the first click. Not a daemon:
+# interpreter exit waits for it rather than killing it inside native loading code.
+threading.Thread(target=_warm_up).start()
@@ -0,0 +1,133 @@
+import hashlib
+import os
+import joblib
+import numpy as np
+
+# Converts the model trained in app.ipynb (Housing.pkl) into the formats the
+# apps load. Run once after retraining: python export_model.py
+
+
+def source_digest(path='Housing.pkl'):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def stamp_path(artifact):
+    # Each export records the digest of the Housing.pkl it was built from, so
+    # core.load_model can tell when a retrain has left it stale
+    return f'{artifact}.sha256'
+
+
+def write_stamp(artifact, digest):
+    with open(stamp_path(artifact), 'w') as f:
+        f.write(digest)
+
+
+def export_onnx(model, path='Housing.onnx'):
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+
+    # Batch dimension left open so the same graph serves single rows and batches
+    onx = convert_sklearn(model, initial_types=[('input', FloatTensorType([None, 12]))])
+    with open(path, 'wb') as f:
+        f.write(onx.SerializeToString())
+
+
+def export_arrays(model, directory='Housing_forest'):
+    # Flattens every tree of the forest into one set of node arrays, loaded
+    # with np.load(mmap_mode='r') by core.load_model. Child indices are
+    # offset into the flat arrays and leaves point back at themselves, so
+    # walking every tree `depth` steps from its root ends on its leaf.
+    left, right, feature, threshold, value, roots = [], [], [], [], [], []
+    offset = 0
+    depth = 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        nodes = np.arange(tree.node_count) + offset
+        leaf = tree.children_left == -1
+        left.append(np.where(leaf, nodes, tree.children_left + offset))
+        right.append(np.where(leaf, nodes, tree.children_right + offset))
+        feature.append(np.where(leaf, 0, tree.feature))
+        threshold.append(np.where(leaf, 0.0, tree.threshold))
+        value.append(tree.value[:, 0, 0])
+        roots.append(offset)
+        offset += tree.node_count
+        depth = max(depth, tree.max_depth)
+
+    # Store every array in the narrowest dtype that loses nothing: 12 features
+    # fit int8 and node indices int32. Thresholds are midpoints between integer
+    # inputs, so they usually survive float32 exactly; check before narrowing.
+    # Leaf values are prices and stay float64.
+    threshold = np.concatenate(threshold)
+    if np.array_equal(threshold.astype(np.float32), threshold):
+        threshold = threshold.astype(np.float32)
+    os.makedirs(directory, exist_ok=True)
+    arrays = {
+        'left': np.concatenate(left).astype(np.int32),
+        'right': np.concatenate(right).astype(np.int32),
+        'feature': np.concatenate(feature).astype(np.int8),
+        'threshold': threshold,
+        'value': np.concatenate(value),
+        'roots': np.array(roots, dtype=np.int32),
+        'depth': np.array(depth),
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(directory, f'{name}.npy'), array)
+
+
+def export_lib(model, path='Housing.so'):
+    import treelite
+    import tl2cgen
+
+    # Native shared library for this machine; *.so is gitignored, so build it where the app runs
+    tl_model = treelite.sklearn.import_model(model)
+    tl2cgen.export_lib(tl_model, toolchain='gcc', libpath=path, params={'parallel_comp': os.cpu_count()})
+
+
+def export_kernels(directory='Housing_forest'):
+    import numba
+    from numba.pycc import CC
+    from kernels import kernel_name, walk_forest
+
+    # AOT-compile the forest walk for the exact dtypes of the exported arrays,
+    # so core.py can import it as a plain extension module with no JIT step
+    arrays = [
+        np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')
+        for name in ('left', 'right', 'feature', 'threshold', 'value', 'roots')
+    ]
+    signature = numba.types.float64[:](
+        numba.types.float32[:, :],
+        *(numba.types.Array(numba.from_dtype(array.dtype), 1, 'A') for array in arrays),
+        numba.types.float64[:],
+    )
+    cc = CC('housing_kernels')
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export(kernel_name(*arrays), signature)(walk_forest)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    model = joblib.load('Housing.pkl')
+    digest = source_digest()
+    export_arrays(model)
+    write_stamp('Housing_forest', digest)
+    print("Exported Housing_forest/")
+    # Kernels first: a failing gcc build of Housing.so must not leave an old
+    # housing_kernels behind (core.py also skips builds whose dtypes don't match)
+    try:
+        export_kernels()
+        print("Exported housing_kernels")
+    except ImportError:
+        print("Skipped housing_kernels (pip install numba to build it)")
+    try:
+        export_lib(model)
+        write_stamp('Housing.so', digest)
+        print("Exported Housing.so")
+    except ImportError:
+        print("Skipped Housing.so (pip install treelite tl2cgen to build it)")
+    try:
+        export_onnx(model)
+        write_stamp('Housing.onnx', digest)
+        print("Exported Housing.onnx")
+    except ImportError:
+        print("Skipped Housing.onnx (pip install skl2onnx onnxruntime to build it)")
@@ -0,0 +1,28 @@
+# Numeric kernels for the Housing_forest node arrays. Kept as plain Python so the
+# same function can be JIT-compiled by core.py or AOT-compiled into the
+# housing_kernels extension by export_model.export_kernels.
+
+
+def walk_forest(X, left, right, feature, threshold, value, roots, out):
+    # Per-row, per-tree walk that stops as soon as a tree hits its leaf
+    # (leaves point back at themselves); out[i] is the forest mean for row i
+    for i in range(X.shape[0]):
+        total = 0.0
+        for root in roots:
+            node = root
+            while left[node] != node:
+                if X[i, feature[node]] <= threshold[node]:
+                    node = left[node]
+                else:
+                    node = right[node]
+            total += value[node]
+        out[i] = total / roots.shape[0]
+    return out
+
+
+def kernel_name(left, right, feature, threshold, value, roots):
+    # Name the AOT build of walk_forest is exported under. pycc functions do not
+    # check argument dtypes, so encoding them in the name lets core.py use a
+    # build only with the arrays it was compiled for, e.g. walk_forest_i4_i4_i1_f4_f8_i4
+    arrays = (left, right, feature, threshold, value, roots)
+    return 'walk_forest_' + '_'.join(array.dtype.str[1:] for array in arrays)